@@ -1,12 +1,12 @@
 import contextlib
-import copy
 import difflib
 import importlib
 import importlib.util
 import re
 import sys
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import (
     Callable,
     Dict,
@@ -43,9 +43,17 @@ else:
 
 from gym import Env, error, logger
 
+# Reference grammar for environment ids, `parse_env_id` implements the same format without the regex engine
 ENV_ID_RE = re.compile(
     r"^(?:(?P<namespace>[\w:-]+)\/)?(?:(?P<name>[\w:.-]+?))(?:-v(?P<version>\d+))?$"
 )
+_ENV_NAMESPACE_CHARS = frozenset("_:-")
+_ENV_NAME_CHARS = frozenset("_:.-")
+
+
+def _is_valid_id_part(part: str, extra_chars: frozenset) -> bool:
+    """Checks that an environment id part is non-empty and only contains word characters or ``extra_chars``."""
+    return part != "" and all(c.isalnum() or c in extra_chars for c in part)
 
 
 def load(name: str) -> callable:
@@ -63,6 +71,7 @@ def load(name: str) -> callable:
     return fn
 
 
+@lru_cache(maxsize=4096)
 def parse_env_id(id: str) -> Tuple[Optional[str], str, Optional[int]]:
     """Parse environment ID string format.
 
@@ -72,6 +81,8 @@ def parse_env_id(id: str) -> Tuple[Optional[str], str, Optional[int]]:
     2016-10-31: We're experimentally expanding the environment ID format
     to include an optional namespace.
 
+    The result is memoized as the same ids are parsed repeatedly by `register`, `make` and `spec`.
+
     Args:
         id: The environment id to parse
 
@@ -81,15 +92,23 @@ def parse_env_id(id: str) -> Tuple[Optional[str], str, Optional[int]]:
     Raises:
         Error: If the environment id does not a valid environment regex
     """
-    match = ENV_ID_RE.fullmatch(id)
-    if not match:
+    namespace, sep, rest = id.partition("/")
+    if not sep:
+        namespace, rest = None, id
+
+    head, sep, version = rest.rpartition("-v")
+    if sep and head and version.isdecimal():
+        name, version = head, int(version)
+    else:
+        name, version = rest, None
+
+    if not _is_valid_id_part(name, _ENV_NAME_CHARS) or (
+        namespace is not None and not _is_valid_id_part(namespace, _ENV_NAMESPACE_CHARS)
+    ):
         raise error.Error(
             f"Malformed environment ID: {id}."
             f"(Currently all IDs must be of the form [namespace/](env-name)-v(version). (namespace is optional))"
         )
-    namespace, name, version = match.group("namespace", "name", "version")
-    if version is not None:
-        version = int(version)
 
     return namespace, name, version
 
@@ -151,6 +170,11 @@ class EnvSpec:
     name: str = field(init=False)
     version: Optional[int] = field(init=False)
 
+    # The environment creator loaded from a string `entry_point`, cached with the `entry_point` it was loaded from
+    _loaded_entry_point: Optional[Tuple[str, Callable]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         # Initialize namespace, name, version
         self.namespace, self.name, self.version = parse_env_id(self.id)
@@ -167,6 +191,7 @@ def _check_namespace_exists(ns: Optional[str]):
     namespaces = {
         spec_.namespace for spec_ in registry.values() if spec_.namespace is not None
     }
+    namespaces.update(_pending_env_plugins)
     if ns in namespaces:
         return
 
@@ -222,12 +247,9 @@ def _check_version_exists(ns: Optional[str], name: str, version: Optional[int]):
 
     message = f"Environment version `v{version}` for environment `{get_env_id(ns, name, None)}` doesn't exist."
 
-    env_specs = [
-        spec_
-        for spec_ in registry.values()
-        if spec_.namespace == ns and spec_.name == name
-    ]
-    env_specs = sorted(env_specs, key=lambda spec_: int(spec_.version or -1))
+    env_specs = sorted(
+        registry.versions(ns, name), key=lambda spec_: int(spec_.version or -1)
+    )
 
     default_spec = [spec_ for spec_ in env_specs if spec_.version is None]
 
@@ -237,10 +259,7 @@ def _check_version_exists(ns: Optional[str], name: str, version: Optional[int]):
             raise error.DeprecatedEnv(message)
 
     # Process possible versioned environments
-
-    versioned_specs = [spec_ for spec_ in env_specs if spec_.version is not None]
-
-    latest_spec = max(versioned_specs, key=lambda spec: spec.version, default=None)  # type: ignore
+    latest_spec = registry.latest(ns, name)
     if latest_spec is not None and version > latest_spec.version:
         version_list_msg = ", ".join(f"`v{spec_.version}`" for spec_ in env_specs)
         message += f" It provides versioned environments: [ {version_list_msg} ]."
@@ -255,15 +274,21 @@ def _check_version_exists(ns: Optional[str], name: str, version: Optional[int]):
 
 
 def find_highest_version(ns: Optional[str], name: str) -> Optional[int]:
-    version: List[int] = [
-        spec_.version
-        for spec_ in registry.values()
-        if spec_.namespace == ns and spec_.name == name and spec_.version is not None
-    ]
-    return max(version, default=None)
+    latest_spec = registry.latest(ns, name)
+    return None if latest_spec is None else latest_spec.version
 
 
 def load_env_plugins(entry_point: str = "gym.envs") -> None:
+    """Loads the third-party environment plugins of the ``entry_point`` group.
+
+    Plugins with a namespace are only loaded when an environment of the namespace is first looked up by
+    `make` or `spec`, avoiding importing every installed environment package with gym.
+    Plugins for the root namespace are loaded immediately as the environments they register can't be known.
+    Until a plugin is loaded, its environments are not in the `registry`.
+
+    Args:
+        entry_point: The entry point group of the plugins
+    """
     # Load third-party environments
     for plugin in metadata.entry_points(group=entry_point):
         # Python 3.8 doesn't support plugin.module, plugin.attr
@@ -287,7 +312,6 @@ def load_env_plugins(entry_point: str = "gym.envs") -> None:
                     f"Gym environment plugin `{module}` must specify a function to execute, not a root module"
                 )
 
-        context = namespace(plugin.name)
         if plugin.name.startswith("__") and plugin.name.endswith("__"):
             # `__internal__` is an artifact of the plugin system when
             # the root namespace had an allow-list. The allow-list is now
@@ -300,13 +324,37 @@ def load_env_plugins(entry_point: str = "gym.envs") -> None:
                     f"The environment namespace magic key `{plugin.name}` is unsupported. "
                     "To register an environment at the root namespace you should specify the `__root__` namespace."
                 )
+                context = namespace(plugin.name)
+            _load_env_plugin(plugin, context)
+        else:
+            _pending_env_plugins.setdefault(plugin.name, []).append(plugin)
+
+
+def _load_env_plugin(plugin, context):
+    """Loads a plugin and runs its registration function within the namespace ``context``."""
+    with context:
+        fn = plugin.load()
+        try:
+            fn()
+        except Exception as e:
+            logger.warn(str(e))
 
-        with context:
-            fn = plugin.load()
-            try:
-                fn()
-            except Exception as e:
-                logger.warn(str(e))
+
+def _load_pending_env_plugins(ns: Optional[str]):
+    """Loads the plugins of a namespace that haven't been loaded yet. Helper function for `make` and `spec`.
+
+    A plugin that fails to load stays pending, such that looking up the namespace again raises the same error.
+    """
+    plugins = _pending_env_plugins.get(ns, [])
+    while plugins:
+        # The plugin is removed before loading in case its registration function looks up the namespace
+        plugin = plugins.pop(0)
+        try:
+            _load_env_plugin(plugin, namespace(plugin.name))
+        except Exception:
+            plugins.insert(0, plugin)
+            raise
+    _pending_env_plugins.pop(ns, None)
 
 
 # fmt: off
@@ -371,33 +419,121 @@ def make(id: Literal[
 # fmt: on
 
 
+class EnvRegistry(dict):
+    """The dictionary of environment specifications, mapping environment ids to :class:`EnvSpec`.
+
+    The specifications of each environment (namespace and name) and its latest versioned specification are indexed
+    as specifications are added and removed. Therefore, every modification of the registry updates the index such
+    that environments can still be added and removed by directly modifying the dictionary.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialises the registry with the, optional, environment specifications in ``args`` and ``kwargs``."""
+        super().__init__()
+        # (namespace, name) -> the environment specifications of every version, keyed by environment id
+        self._env_specs: Dict[Tuple[Optional[str], str], Dict[str, EnvSpec]] = {}
+        # (namespace, name) -> the environment specification with the highest version
+        self._latest: Dict[Tuple[Optional[str], str], EnvSpec] = {}
+        self.update(*args, **kwargs)
+
+    def versions(self, ns: Optional[str], name: str) -> List[EnvSpec]:
+        """Returns the environment specifications of every version for a namespace and name."""
+        return list(self._env_specs.get((ns, name), {}).values())
+
+    def latest(self, ns: Optional[str], name: str) -> Optional[EnvSpec]:
+        """Returns the environment specification with the highest version for a namespace and name, if one exists."""
+        return self._latest.get((ns, name))
+
+    def _add_to_index(self, key: str, spec_: EnvSpec):
+        env_name = (spec_.namespace, spec_.name)
+        self._env_specs.setdefault(env_name, {})[key] = spec_
+        if spec_.version is None:
+            return
+        latest_spec = self._latest.get(env_name)
+        if latest_spec is None or spec_.version > latest_spec.version:
+            self._latest[env_name] = spec_
+
+    def _remove_from_index(self, key: str, spec_: EnvSpec):
+        env_name = (spec_.namespace, spec_.name)
+        env_specs = self._env_specs[env_name]
+        del env_specs[key]
+        if not env_specs:
+            del self._env_specs[env_name]
+        if self._latest.get(env_name) is not spec_:
+            return
+        latest_spec = max(
+            (other for other in env_specs.values() if other.version is not None),
+            key=lambda other: other.version,
+            default=None,
+        )
+        if latest_spec is None:
+            del self._latest[env_name]
+        else:
+            self._latest[env_name] = latest_spec
+
+    def __setitem__(self, key: str, value: EnvSpec):
+        old_value = self.get(key)
+        super().__setitem__(key, value)
+        if old_value is not None:
+            self._remove_from_index(key, old_value)
+        self._add_to_index(key, value)
+
+    def __delitem__(self, key: str):
+        value = self[key]
+        super().__delitem__(key)
+        self._remove_from_index(key, value)
+
+    def pop(self, key: str, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._remove_from_index(key, value)
+        return key, value
+
+    def setdefault(self, key: str, default: Optional[EnvSpec] = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._env_specs.clear()
+        self._latest.clear()
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
 # Global registry of environments. Meant to be accessed through `register` and `make`
-registry: Dict[str, EnvSpec] = {}
+registry: EnvRegistry = EnvRegistry()
 current_namespace: Optional[str] = None
+# Plugins registered through the entry points which are loaded on the first lookup of their namespace
+_pending_env_plugins: Dict[str, list] = {}
 
 
 def _check_spec_register(spec: EnvSpec):
     """Checks whether the spec is valid to be registered. Helper function for `register`."""
     global registry
-    latest_versioned_spec = max(
-        (
-            spec_
-            for spec_ in registry.values()
-            if spec_.namespace == spec.namespace
-            and spec_.name == spec.name
-            and spec_.version is not None
-        ),
-        key=lambda spec_: int(spec_.version),  # type: ignore
-        default=None,
-    )
+    latest_versioned_spec = registry.latest(spec.namespace, spec.name)
 
     unversioned_spec = next(
         (
             spec_
-            for spec_ in registry.values()
-            if spec_.namespace == spec.namespace
-            and spec_.name == spec.name
-            and spec_.version is None
+            for spec_ in registry.versions(spec.namespace, spec.name)
+            if spec_.version is None
         ),
         None,
     )
@@ -419,6 +555,25 @@ def _check_spec_register(spec: EnvSpec):
         )
 
 
+def _load_env_creator(spec: EnvSpec) -> Callable:
+    """Gets the environment creator of a spec. Helper function for `make`.
+
+    The creator loaded from a string entry point is cached on the spec, avoiding importing it on every `make` call.
+    """
+    if spec.entry_point is None:
+        raise error.Error(f"{spec.id} registered but entry_point is not specified")
+    elif callable(spec.entry_point):
+        return spec.entry_point
+
+    # Assume it's a string
+    if (
+        spec._loaded_entry_point is None
+        or spec._loaded_entry_point[0] != spec.entry_point
+    ):
+        spec._loaded_entry_point = (spec.entry_point, load(spec.entry_point))
+    return spec._loaded_entry_point[1]
+
+
 # Public API
 
 
@@ -427,8 +582,10 @@ def namespace(ns: str):
     global current_namespace
     old_namespace = current_namespace
     current_namespace = ns
-    yield
-    current_namespace = old_namespace
+    try:
+        yield
+    finally:
+        current_namespace = old_namespace
 
 
 def register(
@@ -478,6 +635,10 @@ def register(
         ns_id = current_namespace
     else:
         ns_id = ns
+        # The namespace's pending plugins are loaded first, such that this registration overrides their environments
+        # and is checked against them
+        if ns in _pending_env_plugins:
+            _load_pending_env_plugins(ns)
 
     full_id = get_env_id(ns_id, name, version)
 
@@ -510,6 +671,8 @@ def make(
     """Create an environment according to the given ID.
 
     To find all available environments use `gym.envs.registry.keys()` for all valid ids.
+    Environments of third-party plugin namespaces are only in the registry once the namespace has been looked up,
+    see :func:`load_env_plugins`.
 
     Args:
         id: Name of the environment. Optionally, a module to import can be included, eg. 'module:Env-v0'
@@ -543,6 +706,8 @@ def make(
                     f"{e}. Environment registration via importing a module failed. "
                     f"Check whether '{module}' contains env registration and can be imported."
                 )
+        if _pending_env_plugins:
+            _load_pending_env_plugins(parse_env_id(id)[0])
         spec_ = registry.get(id)
 
         ns, name, version = parse_env_id(id)
@@ -569,16 +734,10 @@ def make(
             _check_version_exists(ns, name, version)
             raise error.Error(f"No registered env with id: {id}")
 
-    _kwargs = spec_.kwargs.copy()
-    _kwargs.update(kwargs)
+    # A new dict is always required as `_kwargs` is modified below and becomes the kwargs of the environment's spec
+    _kwargs = {**spec_.kwargs, **kwargs}
 
-    if spec_.entry_point is None:
-        raise error.Error(f"{spec_.id} registered but entry_point is not specified")
-    elif callable(spec_.entry_point):
-        env_creator = spec_.entry_point
-    else:
-        # Assume it's a string
-        env_creator = load(spec_.entry_point)
+    env_creator = _load_env_creator(spec_)
 
     mode = _kwargs.get("render_mode")
     apply_human_rendering = False
@@ -651,9 +810,8 @@ def make(
         else:
             raise e
 
-    # Copies the environment creation specification and kwargs to add to the environment specification details
-    spec_ = copy.deepcopy(spec_)
-    spec_.kwargs = _kwargs
+    # Copies the environment creation specification with the kwargs to add to the environment specification details
+    spec_ = replace(spec_, kwargs=_kwargs)
     env.unwrapped.spec = spec_
 
     # Add step API wrapper
@@ -693,6 +851,8 @@ def make(
 
 def spec(env_id: str) -> EnvSpec:
     """Retrieve the spec for the given environment from the global registry."""
+    if _pending_env_plugins:
+        _load_pending_env_plugins(parse_env_id(env_id)[0])
     spec_ = registry.get(env_id)
     if spec_ is None:
         ns, name, version = parse_env_id(env_id)
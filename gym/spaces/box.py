@@ -101,11 +101,11 @@ class Box(Space[np.ndarray]):
             )
 
         # Capture the boundedness information before replacing np.inf with get_inf
-        _low = np.full(shape, low, dtype=float) if is_float_integer(low) else low
-        self.bounded_below = -np.inf < _low
-        _high = np.full(shape, high, dtype=float) if is_float_integer(high) else high
-        self.bounded_above = np.inf > _high
+        self.bounded_below = _broadcast_bool(-np.inf < low, shape)
+        self.bounded_above = _broadcast_bool(np.inf > high, shape)
 
+        # Scalar bounds are broadcast to read-only views with the space's dtype, therefore don't need to be copied
+        copy_low, copy_high = not is_float_integer(low), not is_float_integer(high)
         low = _broadcast(low, dtype, shape, inf_sign="-")  # type: ignore
         high = _broadcast(high, dtype, shape, inf_sign="+")  # type: ignore
 
@@ -125,8 +125,8 @@ class Box(Space[np.ndarray]):
         dtype_precision = get_precision(self.dtype)
         if min(low_precision, high_precision) > dtype_precision:  # type: ignore
             logger.warn(f"Box bound precision lowered by casting to {self.dtype}")
-        self.low = low.astype(self.dtype)
-        self.high = high.astype(self.dtype)
+        self.low = low.astype(self.dtype, copy=copy_low)
+        self.high = high.astype(self.dtype, copy=copy_high)
 
         self.low_repr = _short_repr(self.low)
         self.high_repr = _short_repr(self.high)
@@ -191,6 +191,14 @@ class Box(Space[np.ndarray]):
             )
 
         high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
+
+        if self.is_bounded():
+            # Fast path for the common fully bounded box, drawing the same values as the masked sampling below
+            sample = self.np_random.uniform(low=self.low, high=high, size=self.shape)
+            if self.dtype.kind == "i":
+                sample = np.floor(sample)
+            return sample.astype(self.dtype)
+
         sample = np.empty(self.shape)
 
         # Masking arrays which classify the coordinates according to interval
@@ -262,8 +270,8 @@ class Box(Space[np.ndarray]):
             isinstance(other, Box)
             and (self.shape == other.shape)
             # and (self.dtype == other.dtype)
-            and np.allclose(self.low, other.low)
-            and np.allclose(self.high, other.high)
+            and _bounds_close(self.low, other.low)
+            and _bounds_close(self.high, other.high)
         )
 
     def __setstate__(self, state: Dict):
@@ -278,6 +286,11 @@ class Box(Space[np.ndarray]):
             self.high_repr = _short_repr(self.high)
 
 
+def _bounds_close(bound: np.ndarray, other_bound: np.ndarray) -> bool:
+    """Checks if two bounds are close, testing exact equality before the slower tolerance based :func:`np.allclose`."""
+    return np.array_equal(bound, other_bound) or np.allclose(bound, other_bound)
+
+
 def get_inf(dtype, sign: str) -> SupportsFloat:
     """Returns an infinite that doesn't break things.
 
@@ -324,10 +337,13 @@ def _broadcast(
     shape: Tuple[int, ...],
     inf_sign: str,
 ) -> np.ndarray:
-    """Handle infinite bounds and broadcast at the same time if needed."""
+    """Handle infinite bounds and broadcast at the same time if needed.
+
+    Scalar values are broadcast to a read-only view of the shape, avoiding allocating an array for the bound.
+    """
     if is_float_integer(value):
         value = get_inf(dtype, inf_sign) if np.isinf(value) else value  # type: ignore
-        value = np.full(shape, value, dtype=dtype)
+        value = np.broadcast_to(np.full((), value, dtype=dtype), shape)
     else:
         assert isinstance(value, np.ndarray)
         if np.any(np.isinf(value)):
@@ -336,3 +352,12 @@ def _broadcast(
             temp[np.isinf(value)] = get_inf(dtype, inf_sign)
             value = temp
     return value
+
+
+def _broadcast_bool(
+    value: Union[bool, np.ndarray], shape: Tuple[int, ...]
+) -> np.ndarray:
+    """Broadcast a boundedness scalar to a read-only view of the shape, arrays are returned unchanged."""
+    if isinstance(value, np.ndarray):
+        return value
+    return np.broadcast_to(np.bool_(value), shape)
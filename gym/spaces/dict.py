@@ -84,7 +84,7 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
         # Convert the spaces into an OrderedDict
         if isinstance(spaces, Mapping) and not isinstance(spaces, OrderedDict):
             try:
-                spaces = OrderedDict(sorted(spaces.items()))
+                spaces = OrderedDict((key, spaces[key]) for key in sorted(spaces))
             except TypeError:
                 # Incomparable types (e.g. `int` vs. `str`, or user-defined types) found.
                 # The keys remain in the insertion order.
@@ -146,9 +146,9 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
             # Using `np.int32` will mean that the same key occurring is extremely low, even for large subspaces
             subseeds = self.np_random.integers(
                 np.iinfo(np.int32).max, size=len(self.spaces)
-            )
+            ).tolist()
             for subspace, subseed in zip(self.spaces.values(), subseeds):
-                seeds += subspace.seed(int(subseed))
+                seeds += subspace.seed(subseed)
         elif seed is None:
             for space in self.spaces.values():
                 seeds += space.seed(None)
@@ -177,17 +177,25 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
             assert (
                 mask.keys() == self.spaces.keys()
             ), f"Expect mask keys to be same as space keys, mask keys: {mask.keys()}, space keys: {self.spaces.keys()}"
-            return OrderedDict(
-                [(k, space.sample(mask[k])) for k, space in self.spaces.items()]
-            )
+            sample = OrderedDict()
+            for key, space in self.spaces.items():
+                sample[key] = space.sample(mask[key])
+            return sample
 
-        return OrderedDict([(k, space.sample()) for k, space in self.spaces.items()])
+        # Filling the `OrderedDict` avoids building an intermediate list of key-sample pairs
+        sample = OrderedDict()
+        for key, space in self.spaces.items():
+            sample[key] = space.sample()
+        return sample
 
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
-        if isinstance(x, dict) and x.keys() == self.spaces.keys():
-            return all(x[key] in self.spaces[key] for key in self.spaces.keys())
-        return False
+        # The keys are checked to be identical first, so each value is looked up only once
+        return (
+            isinstance(x, dict)
+            and x.keys() == self.spaces.keys()
+            and all(space.contains(x[key]) for key, space in self.spaces.items())
+        )
 
     def __getitem__(self, key: str) -> Space:
         """Get the space that is associated to `key`."""
@@ -202,7 +210,7 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
 
     def __iter__(self):
         """Iterator through the keys of the subspaces."""
-        yield from self.spaces
+        return iter(self.spaces)
 
     def __len__(self) -> int:
         """Gives the number of simpler spaces that make up the `Dict` space."""
@@ -237,9 +245,7 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
             for key, space in self.spaces.items()
         }
 
-        n_elements = len(next(iter(dict_of_list.values())))
-        result = [
-            OrderedDict({key: value[n] for key, value in dict_of_list.items()})
-            for n in range(n_elements)
+        return [
+            OrderedDict(zip(dict_of_list.keys(), values))
+            for values in zip(*dict_of_list.values())
         ]
-        return result
@@ -73,9 +73,9 @@ class Tuple(Space[tuple], CollectionSequence):
             seeds = super().seed(seed)
             subseeds = self.np_random.integers(
                 np.iinfo(np.int32).max, size=len(self.spaces)
-            )
+            ).tolist()
             for subspace, subseed in zip(self.spaces, subseeds):
-                seeds += subspace.seed(int(subseed))
+                seeds += subspace.seed(subseed)
         elif seed is None:
             for space in self.spaces:
                 seeds += space.seed(seed)
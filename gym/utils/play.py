@@ -1,5 +1,5 @@
 """Utilities of visualising an environment."""
-from collections import deque
+from itertools import chain
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -29,6 +29,20 @@ except ImportError:
     logger.warn("Matplotlib is not installed, run `pip install gym[other]`")
     matplotlib, plt = None, None
 
+try:
+    from numba import njit
+except ImportError:
+    _normalize_kernel = None
+else:
+
+    @njit(cache=True)
+    def _normalize_kernel(arr, arr_min, arr_range, out):
+        """Normalises the flat ``arr`` into ``out`` in a single pass, computing as :func:`_normalize_arr` does."""
+        for i in range(arr.size):
+            out[i] = np.uint8(
+                (np.float32(arr[i]) - arr_min) * np.float32(255) / arr_range
+            )
+
 
 class MissingKeysToAction(Exception):
     """Raised when the environment does not have a default ``keys_to_action`` mapping."""
@@ -57,15 +71,29 @@ class PlayableGame:
             )
 
         self.env = env
+        keys_to_action = self._get_keys_to_action(keys_to_action)
         self.relevant_keys = self._get_relevant_keys(keys_to_action)
         self.video_size = self._get_video_size(zoom)
         self.screen = pygame.display.set_mode(self.video_size)
         self.pressed_keys = []
         self.running = True
 
-    def _get_relevant_keys(
+        # The pressed keys are also tracked as a bitmask, such that the action of a key combination is a dict lookup
+        self._key_bits = {key: 1 << bit for bit, key in enumerate(self.relevant_keys)}
+        self._pressed_mask = 0
+        self._action_by_mask = {
+            self._keys_mask(keys): action for keys, action in keys_to_action.items()
+        }
+
+        # Buffers and surfaces reused by `display_arr` to normalise and show every rendered frame
+        self._float_buffer: Optional[np.ndarray] = None
+        self._uint8_buffer: Optional[np.ndarray] = None
+        self._surface: Optional[Surface] = None
+        self._scaled_surface: Optional[Surface] = None
+
+    def _get_keys_to_action(
         self, keys_to_action: Optional[Dict[Tuple[int], int]] = None
-    ) -> set:
+    ) -> dict:
         if keys_to_action is None:
             if hasattr(self.env, "get_keys_to_action"):
                 keys_to_action = self.env.get_keys_to_action()
@@ -77,9 +105,18 @@ class PlayableGame:
                     "please specify one manually"
                 )
         assert isinstance(keys_to_action, dict)
-        relevant_keys = set(sum((list(k) for k in keys_to_action.keys()), []))
+        return keys_to_action
+
+    def _get_relevant_keys(self, keys_to_action: Dict[Tuple[int], int]) -> set:
+        relevant_keys = set(chain.from_iterable(keys_to_action.keys()))
         return relevant_keys
 
+    def _keys_mask(self, keys: Tuple[int, ...]) -> int:
+        mask = 0
+        for key in keys:
+            mask |= self._key_bits[key]
+        return mask
+
     def _get_video_size(self, zoom: Optional[float] = None) -> Tuple[int, int]:
         rendered = self.env.render()
         if isinstance(rendered, List):
@@ -104,17 +141,82 @@ class PlayableGame:
         if event.type == pygame.KEYDOWN:
             if event.key in self.relevant_keys:
                 self.pressed_keys.append(event.key)
+                self._pressed_mask |= self._key_bits[event.key]
             elif event.key == pygame.K_ESCAPE:
                 self.running = False
         elif event.type == pygame.KEYUP:
             if event.key in self.relevant_keys:
                 self.pressed_keys.remove(event.key)
+                if event.key not in self.pressed_keys:
+                    self._pressed_mask &= ~self._key_bits[event.key]
         elif event.type == pygame.QUIT:
             self.running = False
         elif event.type == VIDEORESIZE:
             self.video_size = event.size
             self.screen = pygame.display.set_mode(self.video_size)
 
+    def display_arr(self, arr: np.ndarray, transpose: bool):
+        """Displays a numpy array on the game's screen, see :func:`display_arr`.
+
+        The buffers used to normalise the array and, for RGB arrays, the surfaces it is drawn and scaled on are
+        kept between calls, avoiding allocating them for every frame.
+
+        Args:
+            arr: The array to show
+            transpose: If to transpose the array on the screen
+        """
+        if self._float_buffer is None or self._float_buffer.shape != arr.shape:
+            self._float_buffer = np.empty(arr.shape, dtype=np.float32)
+            self._uint8_buffer = np.empty(arr.shape, dtype=np.uint8)
+        arr = _normalize_arr(arr, self._float_buffer, self._uint8_buffer)
+        arr = arr.swapaxes(0, 1) if transpose else arr
+
+        if arr.ndim != 3:
+            # Other arrays are drawn with a palette by `make_surface` that `blit_array` doesn't support
+            pyg_img = pygame.surfarray.make_surface(arr)
+            self.screen.blit(pygame.transform.scale(pyg_img, self.video_size), (0, 0))
+            return
+
+        if self._surface is None or self._surface.get_size() != arr.shape[:2]:
+            self._surface = pygame.surfarray.make_surface(arr)
+        else:
+            pygame.surfarray.blit_array(self._surface, arr)
+        if self._scaled_surface is None or self._scaled_surface.get_size() != tuple(
+            self.video_size
+        ):
+            self._scaled_surface = pygame.Surface(self.video_size, 0, self._surface)
+        pygame.transform.scale(self._surface, self.video_size, self._scaled_surface)
+        self.screen.blit(self._scaled_surface, (0, 0))
+
+
+def _normalize_arr(
+    arr: np.ndarray,
+    float_buffer: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Normalises an array to the range [0, 255] as ``uint8``, computing in-place in the optional buffers.
+
+    If Numba is installed, the normalisation into ``out`` is done by a single compiled pass over the array.
+    ``uint8`` arrays that already span [0, 255] are unchanged by the normalisation and are returned as is.
+    """
+    arr_min, arr_max = arr.min(), arr.max()
+    if arr.dtype == np.uint8 and arr_min == 0 and arr_max == 255:
+        return arr
+    # Multiplying before dividing by the range ensures that the maximum is exactly 255 rather than truncated to 254
+    arr_range = max(float(arr_max) - float(arr_min), 1e-12)
+    if _normalize_kernel is not None and out is not None:
+        _normalize_kernel(
+            arr.ravel(), np.float32(arr_min), np.float32(arr_range), out.reshape(-1)
+        )
+        return out
+    float_buffer = np.subtract(arr, arr_min, out=float_buffer, dtype=np.float32)
+    np.multiply(float_buffer, 255.0, out=float_buffer)
+    np.divide(float_buffer, arr_range, out=float_buffer)
+    if out is None:
+        return float_buffer.astype(np.uint8)
+    np.copyto(out, float_buffer, casting="unsafe")
+    return out
+
 
 def display_arr(
     screen: Surface, arr: np.ndarray, video_size: Tuple[int, int], transpose: bool
@@ -127,8 +229,7 @@ def display_arr(
         video_size: The video size of the screen
         transpose: If to transpose the array on the screen
     """
-    arr_min, arr_max = np.min(arr), np.max(arr)
-    arr = 255.0 * (arr - arr_min) / (arr_max - arr_min)
+    arr = _normalize_arr(arr)
     pyg_img = pygame.surfarray.make_surface(arr.swapaxes(0, 1) if transpose else arr)
     pyg_img = pygame.transform.scale(pyg_img, video_size)
     screen.blit(pyg_img, (0, 0))
@@ -251,7 +352,7 @@ def play(
             done = False
             obs = env.reset(seed=seed)
         else:
-            action = key_code_to_action.get(tuple(sorted(game.pressed_keys)), noop)
+            action = game._action_by_mask.get(game._pressed_mask, noop)
             prev_obs = obs
             obs, rew, terminated, truncated, info = env.step(action)
             done = terminated or truncated
@@ -262,9 +363,7 @@ def play(
             if isinstance(rendered, List):
                 rendered = rendered[-1]
             assert rendered is not None and isinstance(rendered, np.ndarray)
-            display_arr(
-                game.screen, rendered, transpose=transpose, video_size=game.video_size
-            )
+            game.display_arr(rendered, transpose=transpose)
 
         # process pygame events
         for event in pygame.event.get():
@@ -338,8 +437,10 @@ class PlayPlot:
         for axis, name in zip(self.ax, plot_names):
             axis.set_title(name)
         self.t = 0
-        self.cur_plot: List[Optional[plt.Axes]] = [None for _ in range(num_plots)]
-        self.data = [deque(maxlen=horizon_timesteps) for _ in range(num_plots)]
+        self.cur_plot = [axis.scatter([], [], c="blue") for axis in self.ax]
+        # Ring buffer of the (timestep, metric) points of each plot over the last `horizon_timesteps` steps
+        self.data = np.zeros((num_plots, horizon_timesteps, 2))
+        plt.show(block=False)
 
     def callback(
         self,
@@ -365,22 +466,25 @@ class PlayPlot:
         points = self.data_callback(
             obs_t, obs_tp1, action, rew, terminated, truncated, info
         )
-        for point, data_series in zip(points, self.data):
-            data_series.append(point)
+        index = self.t % self.horizon_timesteps
+        self.data[:, index, 0] = self.t
+        self.data[:, index, 1] = points
         self.t += 1
 
         xmin, xmax = max(0, self.t - self.horizon_timesteps), self.t
 
-        for i, plot in enumerate(self.cur_plot):
-            if plot is not None:
-                plot.remove()
-            self.cur_plot[i] = self.ax[i].scatter(
-                range(xmin, xmax), list(self.data[i]), c="blue"
-            )
-            self.ax[i].set_xlim(xmin, xmax)
+        # The scatter plots are updated in place rather than being removed and recreated
+        for axis, plot, data_series in zip(self.ax, self.cur_plot, self.data):
+            offsets = data_series[: xmax - xmin]
+            plot.set_offsets(offsets)
+            axis.update_datalim(offsets)
+            axis.autoscale_view(scalex=False)
+            axis.set_xlim(xmin, xmax)
 
         if plt is None:
             raise DependencyNotInstalled(
                 "matplotlib is not installed, run `pip install gym[other]`"
             )
-        plt.pause(0.000001)
+        # Unlike `plt.pause`, this redraws and processes the GUI events without sleeping
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
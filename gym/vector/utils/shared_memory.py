@@ -1,8 +1,9 @@
 """Utility functions for vector environments to share memory between processes."""
 import multiprocessing as mp
+import operator as op
 from collections import OrderedDict
 from ctypes import c_bool
-from functools import singledispatch
+from functools import reduce, singledispatch
 from typing import Union
 
 import numpy as np
@@ -162,11 +163,12 @@ def write_to_shared_memory(
 @write_to_shared_memory.register(MultiDiscrete)
 @write_to_shared_memory.register(MultiBinary)
 def _write_base_to_shared_memory(space, index, value, shared_memory):
-    size = int(np.prod(space.shape))
+    size = reduce(op.mul, space.shape, 1)
     destination = np.frombuffer(shared_memory.get_obj(), dtype=space.dtype)
+    # `ravel` avoids copying the value before it is copied into the shared memory
     np.copyto(
         destination[index * size : (index + 1) * size],
-        np.asarray(value, dtype=space.dtype).flatten(),
+        np.asarray(value, dtype=space.dtype).ravel(),
     )
 
 
@@ -31,6 +31,18 @@ class TransformObservation(gym.ObservationWrapper):
         assert callable(f)
         self.f = f
 
+    @property
+    def f(self) -> Callable[[Any], Any]:
+        """The function that transforms the observation."""
+        return self._f
+
+    @f.setter
+    def f(self, f: Callable[[Any], Any]):
+        self._f = f
+        if type(self).observation is TransformObservation.observation:
+            # Calling `f` directly in `reset` and `step` avoids a Python frame per observation
+            self.observation = f
+
     def observation(self, observation):
         """Transforms the observations with callable :attr:`f`.
 
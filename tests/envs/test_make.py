@@ -299,6 +299,11 @@ def test_make_kwargs():
     assert env.arg3 == "override_arg3"
     env.close()
 
+    # The registered spec's kwargs are not shared with or modified by the environment's spec
+    registered_kwargs = gym.spec("test.ArgumentEnv-v0").kwargs
+    assert registered_kwargs == {"arg1": "arg1", "arg2": "arg2"}
+    assert env.spec.kwargs is not registered_kwargs
+
 
 def test_import_module_during_make():
     # Test custom environment which is registered at make
@@ -308,3 +313,21 @@ def test_import_module_during_make():
     )
     assert isinstance(env.unwrapped, RegisterDuringMakeEnv)
     env.close()
+
+
+def test_make_loaded_entry_point():
+    """Tests that entry points are loaded once and reloaded if the spec's entry point changes."""
+    spec = gym.envs.registration.EnvSpec(
+        "test.LoadedEntryPoint-v0",
+        "tests.envs.utils_envs:RegisterDuringMakeEnv",
+    )
+    env = gym.make(spec, disable_env_checker=True)
+    assert isinstance(env.unwrapped, RegisterDuringMakeEnv)
+    assert spec._loaded_entry_point == (spec.entry_point, RegisterDuringMakeEnv)
+    env.close()
+
+    spec.entry_point = "tests.envs.utils_envs:ArgumentEnv"
+    env = gym.make(spec, arg1=1, arg2=2, arg3=3, disable_env_checker=True)
+    assert isinstance(env.unwrapped, ArgumentEnv)
+    assert spec._loaded_entry_point == (spec.entry_point, ArgumentEnv)
+    env.close()
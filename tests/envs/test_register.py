@@ -90,6 +90,38 @@ def test_register_error(env_id):
         gym.register(env_id, "no-entry-point")
 
 
+@pytest.mark.parametrize(
+    "env_id",
+    [
+        "MyAwesomeNamespace/MyAwesomeEnv-v0",
+        "My:Awesome-Namespace/My.Awesome:Env-v1-v2",
+        "MyAwesomeEnv-vfinal-v0",
+        "MyAwesomeEnv-v-v01",
+        "MyAwesomeEnv-v",
+        "-v0",
+        "MyAwesomeEnv-v²",
+        "/MyAwesomeEnv-v0",
+        "MyAwesomeNamespace/",
+        "My.Namespace/MyAwesomeEnv-v0",
+        "MyAwesomeEnv-v0\n",
+        "",
+    ],
+)
+def test_parse_env_id_matches_regex(env_id):
+    """Checks that `parse_env_id` parses ids identically to the reference `ENV_ID_RE` grammar."""
+    match = gym.envs.registration.ENV_ID_RE.fullmatch(env_id)
+    if match is None:
+        with pytest.raises(gym.error.Error, match="^Malformed environment ID"):
+            gym.envs.registration.parse_env_id(env_id)
+    else:
+        namespace, name, version = match.group("namespace", "name", "version")
+        assert gym.envs.registration.parse_env_id(env_id) == (
+            namespace,
+            name,
+            None if version is None else int(version),
+        )
+
+
 @pytest.mark.parametrize(
     "env_id_input, env_id_suggested",
     [
@@ -196,3 +228,129 @@ def test_namespace():
 
     del gym.envs.registry["MyDefaultNamespace/MyDefaultEnvironment-v0"]
     del gym.envs.registry["MyDefaultEnvironment-v1"]
+
+
+def test_make_after_registry_modification():
+    """Checks that the cached environment resolution in `make` is updated when the registry is directly modified."""
+    gym.register("MyCachedEnv-v0", "tests.envs.utils_envs:ArgumentEnv")
+    gym.register("MyCachedEnv-v1", "tests.envs.utils_envs:ArgumentEnv")
+    kwargs = {"arg1": None, "arg2": None, "arg3": None}
+    with pytest.warns(UserWarning, match=re.escape("`MyCachedEnv-v1`")):
+        env = gym.make("MyCachedEnv", disable_env_checker=True, **kwargs)
+    assert env.spec.id == "MyCachedEnv-v1"
+
+    del gym.envs.registry["MyCachedEnv-v1"]
+    with pytest.warns(UserWarning, match=re.escape("`MyCachedEnv-v0`")):
+        env = gym.make("MyCachedEnv", disable_env_checker=True, **kwargs)
+    assert env.spec.id == "MyCachedEnv-v0"
+
+    gym.envs.registry.pop("MyCachedEnv-v0")
+    with pytest.raises(gym.error.NameNotFound):
+        gym.make("MyCachedEnv", disable_env_checker=True, **kwargs)
+
+
+def test_registry_index():
+    """Checks that the environment versions and latest version are maintained as the registry is modified."""
+    env_registry = gym.envs.registration.EnvRegistry()
+    for env_id in ["MyEnv-v1", "MyEnv-v3", "MyEnv-v2", "MyNamespace/MyEnv-v5"]:
+        env_registry[env_id] = gym.envs.registration.EnvSpec(env_id, "no-entry-point")
+    assert env_registry.latest(None, "MyEnv").id == "MyEnv-v3"
+    assert env_registry.latest("MyNamespace", "MyEnv").id == "MyNamespace/MyEnv-v5"
+    assert env_registry.latest(None, "MyOtherEnv") is None
+    assert [spec.id for spec in env_registry.versions(None, "MyEnv")] == [
+        "MyEnv-v1",
+        "MyEnv-v3",
+        "MyEnv-v2",
+    ]
+
+    del env_registry["MyEnv-v3"]
+    assert env_registry.latest(None, "MyEnv").id == "MyEnv-v2"
+    env_registry.pop("MyEnv-v1")
+    assert env_registry.latest(None, "MyEnv").id == "MyEnv-v2"
+    env_registry.pop("MyEnv-v2")
+    assert env_registry.latest(None, "MyEnv") is None
+    assert env_registry.versions(None, "MyEnv") == []
+
+    env_registry.update({"MyEnv-v4": gym.envs.registration.EnvSpec("MyEnv-v4", "")})
+    assert env_registry.latest(None, "MyEnv").id == "MyEnv-v4"
+    env_registry.clear()
+    assert env_registry.latest("MyNamespace", "MyEnv") is None
+
+
+def test_load_env_plugins_lazily(monkeypatch):
+    """Checks that namespaced plugins are only loaded when their namespace is looked up."""
+    plugin = gym.envs.registration.metadata.EntryPoint(
+        name="MyPluginNamespace",
+        value="tests.envs.utils_envs:register_plugin_envs",
+        group="gym.envs",
+    )
+    monkeypatch.setattr(
+        gym.envs.registration.metadata, "entry_points", lambda group: [plugin]
+    )
+    monkeypatch.setattr(gym.envs.registration, "_pending_env_plugins", {})
+    gym.envs.registration.load_env_plugins()
+    assert "MyPluginNamespace/MyPluginEnv-v0" not in gym.envs.registry
+
+    with pytest.raises(
+        gym.error.NamespaceNotFound, match="Did you mean: `MyPluginNamespace`"
+    ):
+        gym.spec("MyPluginNamspace/MyPluginEnv-v0")
+
+    spec = gym.spec("MyPluginNamespace/MyPluginEnv-v0")
+    assert spec.namespace == "MyPluginNamespace"
+    assert "MyPluginNamespace" not in gym.envs.registration._pending_env_plugins
+
+    del gym.envs.registry["MyPluginNamespace/MyPluginEnv-v0"]
+
+
+def test_register_overrides_pending_env_plugin(monkeypatch):
+    """Checks that registering an environment of a pending plugin's namespace overrides the plugin's environment."""
+    plugin = gym.envs.registration.metadata.EntryPoint(
+        name="MyPluginNamespace",
+        value="tests.envs.utils_envs:register_plugin_envs",
+        group="gym.envs",
+    )
+    monkeypatch.setattr(
+        gym.envs.registration.metadata, "entry_points", lambda group: [plugin]
+    )
+    monkeypatch.setattr(gym.envs.registration, "_pending_env_plugins", {})
+    gym.envs.registration.load_env_plugins()
+
+    with pytest.warns(
+        UserWarning,
+        match=re.escape(
+            "Overriding environment MyPluginNamespace/MyPluginEnv-v0 already in registry."
+        ),
+    ):
+        gym.register(
+            "MyPluginNamespace/MyPluginEnv-v0", "tests.envs.utils_envs:ArgumentEnv"
+        )
+    assert gym.envs.registration._pending_env_plugins == {}
+    assert (
+        gym.spec("MyPluginNamespace/MyPluginEnv-v0").entry_point
+        == "tests.envs.utils_envs:ArgumentEnv"
+    )
+
+    del gym.envs.registry["MyPluginNamespace/MyPluginEnv-v0"]
+
+
+def test_load_env_plugins_failure(monkeypatch):
+    """Checks that a plugin failing to load leaves the namespace unchanged and is loaded again on the next lookup."""
+    plugin = gym.envs.registration.metadata.EntryPoint(
+        name="MyBrokenNamespace",
+        value="tests.envs.missing_module:register_plugin_envs",
+        group="gym.envs",
+    )
+    monkeypatch.setattr(
+        gym.envs.registration.metadata, "entry_points", lambda group: [plugin]
+    )
+    monkeypatch.setattr(gym.envs.registration, "_pending_env_plugins", {})
+    gym.envs.registration.load_env_plugins()
+
+    for _ in range(2):
+        with pytest.raises(ModuleNotFoundError, match="tests.envs.missing_module"):
+            gym.make("MyBrokenNamespace/MyPluginEnv-v0")
+        assert gym.envs.registration.current_namespace is None
+        assert gym.envs.registration._pending_env_plugins == {
+            "MyBrokenNamespace": [plugin]
+        }
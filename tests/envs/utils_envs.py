@@ -47,3 +47,8 @@ class NoHumanNoRGB(gym.Env):
     def __init__(self, render_mode=None):
         assert render_mode in self.metadata["render_modes"]
         self.render_mode = render_mode
+
+
+def register_plugin_envs():
+    """Used in `test_register.py` to check that plugins are loaded on the first lookup of their namespace"""
+    gym.register("MyPluginEnv-v0", "tests.envs.utils_envs:RegisterDuringMakeEnv")
@@ -314,3 +314,41 @@ def test_sample_mask():
         match=re.escape("Box.sample cannot be provided a mask, actual value: "),
     ):
         space.sample(mask=np.array([0, 1, 0], dtype=np.int8))
+
+
+def test_box_equality_tolerance():
+    """Tests that box equality allows for small differences in the bounds, as well as exact matches."""
+    box = Box(low=np.array([-1.0, 0.0]), high=np.array([1.0, np.inf]), dtype=np.float64)
+    assert box == Box(
+        low=np.array([-1.0, 0.0]), high=np.array([1.0, np.inf]), dtype=np.float64
+    )
+    assert box == Box(
+        low=np.array([-1.0, 1e-10]), high=np.array([1.0, np.inf]), dtype=np.float64
+    )
+    assert box != Box(
+        low=np.array([-1.0, 0.1]), high=np.array([1.0, np.inf]), dtype=np.float64
+    )
+    assert box != Box(
+        low=np.array([-1.0, 0.0]), high=np.array([1.0, 1.0]), dtype=np.float64
+    )
+
+
+def test_scalar_bounds_broadcast():
+    """Tests that scalar bounds are broadcast as read-only views while array bounds are copied."""
+    space = Box(low=0, high=255, shape=(210, 160, 3), dtype=np.uint8)
+    assert space.low.strides == (0, 0, 0) and space.high.strides == (0, 0, 0)
+    assert not space.low.flags.writeable and not space.high.flags.writeable
+    assert space.low.dtype == space.high.dtype == np.uint8
+    assert space.is_bounded() and space.contains(space.sample())
+
+    low = np.zeros(3, dtype=np.float32)
+    space = Box(low=low, high=1.0, dtype=np.float32)
+    assert space.low is not low and space.low.flags.writeable
+    assert not space.high.flags.writeable
+
+    # Scalar bounds outside the dtype's range are cast as `np.full` does, without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        space = Box(low=-1, high=300, shape=(2,), dtype=np.uint8)
+    assert np.array_equal(space.low, np.full((2,), -1, dtype=np.uint8))
+    assert np.array_equal(space.high, np.full((2,), 300, dtype=np.uint8))
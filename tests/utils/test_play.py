@@ -9,6 +9,7 @@ from pygame import KEYDOWN, KEYUP, QUIT, event
 from pygame.event import Event
 
 import gym
+import gym.utils.play
 from gym.utils.play import MissingKeysToAction, PlayableGame, play
 from tests.testing_env import GenericTestEnv
 
@@ -140,6 +141,75 @@ def test_keyboard_keyup_event():
     assert game.pressed_keys == []
 
 
+def test_keyboard_pressed_mask():
+    env = PlayableEnv(render_mode="rgb_array")
+    keys_to_action = {**dummy_keys_to_action(), (RELEVANT_KEY_1, RELEVANT_KEY_2): 2}
+    game = PlayableGame(env, keys_to_action)
+    assert game._action_by_mask.get(game._pressed_mask) is None
+
+    game.process_event(Event(pygame.KEYDOWN, {"key": RELEVANT_KEY_2}))
+    assert game._action_by_mask[game._pressed_mask] == 1
+    game.process_event(Event(pygame.KEYDOWN, {"key": RELEVANT_KEY_1}))
+    assert game._action_by_mask[game._pressed_mask] == 2
+    game.process_event(Event(pygame.KEYUP, {"key": RELEVANT_KEY_2}))
+    assert game._action_by_mask[game._pressed_mask] == 0
+    game.process_event(Event(pygame.KEYUP, {"key": RELEVANT_KEY_1}))
+    assert game._pressed_mask == 0
+
+
+def test_display_arr():
+    env = PlayableEnv(render_mode="rgb_array")
+    game = PlayableGame(env, dummy_keys_to_action())
+    arr = np.linspace(-1, 1, 10 * 10 * 3).reshape((10, 10, 3))
+    game.display_arr(arr, transpose=True)
+    uint8_buffer, surface = game._uint8_buffer, game._surface
+    assert uint8_buffer.min() == 0 and uint8_buffer.max() == 255
+
+    game.display_arr(arr, transpose=True)
+    assert game._uint8_buffer is uint8_buffer
+    assert game._surface is surface
+
+
+@pytest.mark.skipif(
+    gym.utils.play._normalize_kernel is None, reason="Numba is not installed"
+)
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(4 * 5 * 3, dtype=np.uint8).reshape((4, 5, 3)),
+        np.linspace(-2, 3, 4 * 5).reshape((4, 5)),
+        np.full((4, 5, 3), 7, dtype=np.float32),
+    ],
+)
+def test_normalize_arr_kernel(arr, monkeypatch):
+    out = gym.utils.play._normalize_arr(
+        arr, np.empty(arr.shape, np.float32), np.empty(arr.shape, np.uint8)
+    )
+
+    monkeypatch.setattr(gym.utils.play, "_normalize_kernel", None)
+    expected = gym.utils.play._normalize_arr(arr)
+    assert np.array_equal(out, expected)
+
+
+def test_normalize_arr_full_range_uint8():
+    arr = np.arange(256, dtype=np.uint8).reshape((16, 16))
+    assert gym.utils.play._normalize_arr(arr) is arr
+
+    arr = np.arange(1, 256, dtype=np.uint8).reshape((15, 17))
+    out = gym.utils.play._normalize_arr(arr)
+    assert out.min() == 0 and out.max() == 255
+
+    # The maximum of every range is normalised to 255, with and without buffers
+    for arr_min, arr_max in product(range(256), range(256)):
+        if arr_min < arr_max:
+            arr = np.array([arr_min, arr_max], dtype=np.uint8)
+            assert gym.utils.play._normalize_arr(arr).tolist() == [0, 255]
+            out = gym.utils.play._normalize_arr(
+                arr, np.empty(2, np.float32), np.empty(2, np.uint8)
+            )
+            assert out.tolist() == [0, 255]
+
+
 def test_play_loop_real_env():
     SEED = 42
     ENV = "CartPole-v1"
@@ -33,3 +33,33 @@ def test_transform_observation(env_id):
     assert np.allclose(wrapped_reward, reward)
     assert wrapped_terminated == terminated
     assert wrapped_truncated == truncated
+
+
+def test_transform_observation_subclass():
+    class OffsetObservation(TransformObservation):
+        def observation(self, observation):
+            return super().observation(observation) + 1
+
+    env = gym.make("CartPole-v1", disable_env_checker=True)
+    wrapped_env = TransformObservation(env, np.negative)
+    assert wrapped_env.observation is np.negative
+
+    obs, _ = env.reset(seed=0)
+    wrapped_env = OffsetObservation(
+        gym.make("CartPole-v1", disable_env_checker=True), np.negative
+    )
+    wrapped_obs, _ = wrapped_env.reset(seed=0)
+    assert np.allclose(wrapped_obs, -obs + 1)
+
+
+def test_transform_observation_reassign_f():
+    env = gym.make("CartPole-v1", disable_env_checker=True)
+    obs, _ = env.reset(seed=0)
+
+    wrapped_env = TransformObservation(
+        gym.make("CartPole-v1", disable_env_checker=True), np.negative
+    )
+    wrapped_env.f = np.square
+    assert wrapped_env.f is np.square
+    wrapped_obs, _ = wrapped_env.reset(seed=0)
+    assert np.allclose(wrapped_obs, np.square(obs))